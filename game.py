@@ -5,6 +5,18 @@ import numpy as np
 
 # Rules on PDF
 
+# indices of the 12 board lines (rows, columns and diagonals) over the flattened board
+LINE_INDICES = np.array(
+    # take the indices of all rows
+    [[y * 5 + x for x in range(5)] for y in range(5)]
+    # take the indices of all columns
+    + [[y * 5 + x for y in range(5)] for x in range(5)]
+    # take the indices of the principal diagonal
+    + [[y * 5 + y for y in range(5)]]
+    # take the indices of the secondary diagonal
+    + [[y * 5 + (4 - y) for y in range(5)]]
+)
+
 
 class Move(Enum):
     '''
@@ -57,30 +69,14 @@ class Game(object):
 
     def check_winner(self) -> int:
         '''Check the winner. Returns the player ID of the winner if any, otherwise returns -1'''
-        # for each row
-        for x in range(self._board.shape[0]):
-            # if a player has completed an entire row
-            if self._board[x, 0] != -1 and all(self._board[x, :] == self._board[x, 0]):
-                # return the relative id
-                return self._board[x, 0]
-        # for each column
-        for y in range(self._board.shape[1]):
-            # if a player has completed an entire column
-            if self._board[0, y] != -1 and all(self._board[:, y] == self._board[0, y]):
-                # return the relative id
-                return self._board[0, y]
-        # if a player has completed the principal diagonal
-        if self._board[0, 0] != -1 and all(
-            [self._board[x, x] for x in range(self._board.shape[0])] == self._board[0, 0]
-        ):
-            # return the relative id
-            return self._board[0, 0]
-        # if a player has completed the secondary diagonal
-        if self._board[0, -1] != -1 and all(
-            [self._board[x, -(x + 1)] for x in range(self._board.shape[0])] == self._board[0, -1]
-        ):
-            # return the relative id
-            return self._board[0, -1]
+        # gather the 12 board lines as a single 12x5 matrix
+        lines = self._board.ravel()[LINE_INDICES]
+        # find the lines entirely taken by one player
+        complete = (lines[:, 0] != -1) & (lines == lines[:, :1]).all(axis=1)
+        # if a player has completed a line
+        if complete.any():
+            # return the relative id, keeping the rows/columns/diagonals scan order
+            return lines[complete.argmax(), 0]
         return -1
 
     def play(self, player1: Player, player2: Player) -> int:
@@ -1,14 +1,20 @@
 from game import Game, Move, Player
-from utils.investigate_game import InvestigateGame
-import pickle
-from collections import namedtuple
+from utils.investigate_game import InvestigateGame, MissNoAddDict
+import numpy as np
 from joblib import Parallel, delayed
 from tqdm import trange
 from players.random_player import RandomPlayer
-from copy import deepcopy
 
 
-EntryMinMax = namedtuple('EntryMinMax', ['depth', 'value'])
+# hoisted bound constants for the searches
+INF = float('inf')
+NEG_INF = float('-inf')
+
+# maximum number of hash table entries kept across moves
+TABLE_SIZE = 2**20
+
+# bound flags of the alpha-beta hash table entries
+EXACT, LOWER, UPPER = 0, 1, 2
 
 
 class MinMaxPlayer(Player):
@@ -30,11 +36,45 @@ class MinMaxPlayer(Player):
         """
         super().__init__()
         self._visited = {}
+        self._eval_cache = {}
+        self._children_cache = {}
+        self._age = 0
         self._depth = depth
-        self._symmetries = symmetries
+        self.symmetries = symmetries
         self._enhance = enhance
         self._parallelize = True
 
+    @property
+    def symmetries(self) -> bool:
+        """
+        Return whether the search only explores canonical transitions.
+
+        Args:
+            None.
+
+        Returns:
+            The symmetries flag is returned.
+        """
+        return self._symmetries
+
+    @symmetries.setter
+    def symmetries(self, value: bool) -> None:
+        """
+        Set the symmetries flag and bind the matching transition generator
+        once, instead of re-evaluating the branch at every search node.
+
+        Args:
+            value: whether to consider the symmetries or not.
+
+        Returns:
+            None.
+        """
+        self._symmetries = value
+        # bind the transition generator used by the recursive methods
+        self._generate_transitions = (
+            InvestigateGame.generate_canonical_transitions if value else InvestigateGame.generate_possible_transitions
+        )
+
     def parallelize(self, activate: bool = True) -> None:
         """
         Decide if to parallelize the MinMax procedure. If parallelization is activated,
@@ -51,6 +91,36 @@ class MinMaxPlayer(Player):
         if activate:
             # reset visited dict state
             self._visited = {}
+            # reset the evaluation cache
+            self._eval_cache = {}
+            # reset the transitions cache
+            self._children_cache = {}
+
+    def _new_generation(self) -> None:
+        """
+        Start a new search generation and bound the memory used by the
+        caches: when the hash table outgrows TABLE_SIZE, the entries that
+        were not touched by the last generation are evicted.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        # start a new generation
+        self._age += 1
+        # if the hash table has grown too large
+        if len(self._visited) > TABLE_SIZE:
+            # keep only the entries stored by the last generation
+            self._visited = {key: entry for key, entry in self._visited.items() if entry[-1] >= self._age - 1}
+        # if the evaluation cache has grown too large
+        if len(self._eval_cache) > TABLE_SIZE:
+            # drop it entirely since its entries carry no age
+            self._eval_cache = {}
+        # drop the cached transitions, which hold full game states and are
+        # only meant to be shared by the deepening passes of one search
+        self._children_cache = {}
 
     def max_value(self, game: 'InvestigateGame', key: int, depth: int) -> int | float:
         """
@@ -67,30 +137,42 @@ class MinMaxPlayer(Player):
             for Max is returned.
         """
         # check if the state is already in hash table
-        if key in self._visited and depth <= self._visited[key].depth:
-            return self._visited[key].value
+        entry = self._visited.get(key)
+        # if it is deep enough
+        if entry is not None and depth <= entry[0]:
+            return entry[1]
 
+        # check for a winner only once per node
+        winner = game.check_winner() if depth > 0 else None
         # if there are no more levels to examine or we are in a terminal state
-        if depth <= 0 or game.check_winner() != -1:
-            # get the heuristic value of the state
-            value = game.evaluation_function(game.current_player_idx, self._enhance)
+        if winner is None or winner != -1:
+            # get the heuristic value of the state, if already computed
+            value = self._eval_cache.get(key)
+            # if the state has never been evaluated
+            if value is None:
+                # get the heuristic value of the state
+                value = game.evaluation_function(game.current_player_idx, self._enhance, winner)
+                # save it in the evaluation cache
+                self._eval_cache[key] = value
             # save the state in hash table
-            self._visited[key] = EntryMinMax(0, value)
+            self._visited[key] = (0, value, self._age)
             # return its heuristic value
             return value
         # set the current best max value
-        value = float('-inf')
-        # get all possible game transitions or canonical transitions
-        transitions = (
-            game.generate_canonical_transitions() if self._symmetries else game.generate_possible_transitions()
-        )
+        value = NEG_INF
+        # get all possible game transitions or canonical transitions, reusing the cache
+        transitions = self._children_cache.get(key)
+        # if the transitions of this state have not been generated yet
+        if transitions is None:
+            transitions = self._generate_transitions(game)
+            self._children_cache[key] = transitions
         # for each possible game transition
-        for _, state, key in transitions:
+        for _, state, child_key in transitions:
             # update the current max value
-            value = max(value, self.min_value(state, key, depth - 1))
+            value = max(value, self.min_value(state, child_key, depth - 1))
 
         # save the state in hash table
-        self._visited[key] = EntryMinMax(depth, value)
+        self._visited[key] = (depth, value, self._age)
         return value
 
     def min_value(self, game: 'InvestigateGame', key: int, depth: int) -> int | float:
@@ -108,30 +190,42 @@ class MinMaxPlayer(Player):
             for Min is returned.
         """
         # check if the state is already in hash table
-        if key in self._visited and depth <= self._visited[key].depth:
-            return self._visited[key].value
+        entry = self._visited.get(key)
+        # if it is deep enough
+        if entry is not None and depth <= entry[0]:
+            return entry[1]
 
+        # check for a winner only once per node
+        winner = game.check_winner() if depth > 0 else None
         # if there are no more levels to examine or we are in a terminal state
-        if depth <= 0 or game.check_winner() != -1:
-            # get the heuristic value
-            value = game.evaluation_function(1 - game.current_player_idx, self._enhance)
+        if winner is None or winner != -1:
+            # get the heuristic value of the state, if already computed
+            value = self._eval_cache.get(key)
+            # if the state has never been evaluated
+            if value is None:
+                # get the heuristic value
+                value = game.evaluation_function(1 - game.current_player_idx, self._enhance, winner)
+                # save it in the evaluation cache
+                self._eval_cache[key] = value
             # save the state in hash table
-            self._visited[key] = EntryMinMax(0, value)
+            self._visited[key] = (0, value, self._age)
             # return its heuristic value
             return value
         # set the current best min value
-        value = float('inf')
-        # get all possible game transitions or canonical transitions
-        transitions = (
-            game.generate_canonical_transitions() if self._symmetries else game.generate_possible_transitions()
-        )
+        value = INF
+        # get all possible game transitions or canonical transitions, reusing the cache
+        transitions = self._children_cache.get(key)
+        # if the transitions of this state have not been generated yet
+        if transitions is None:
+            transitions = self._generate_transitions(game)
+            self._children_cache[key] = transitions
         # for each possible game transition
-        for _, state, key in transitions:
+        for _, state, child_key in transitions:
             # update the current min value
-            value = min(value, self.max_value(state, key, depth - 1))
+            value = min(value, self.max_value(state, child_key, depth - 1))
 
         # save the state in hash table
-        self._visited[key] = EntryMinMax(depth, value)
+        self._visited[key] = (depth, value, self._age)
         return value
 
     def make_move(self, game: 'Game') -> tuple[tuple[int, int], Move]:
@@ -144,6 +238,8 @@ class MinMaxPlayer(Player):
         Returns:
             The best move to play for Max is returned.
         """
+        # start a new search generation
+        self._new_generation()
         # create seperate instance of a game for investigation
         game = InvestigateGame(game)
         # get first canonical level
@@ -159,13 +255,16 @@ class MinMaxPlayer(Player):
             # do not parallelize
             values = [self.min_value(state, key, self._depth - 1) for _, state, key in transitions]
 
+        # define the best value and action found so far
+        best_value, best_action = NEG_INF, None
+        # for each root transition and its value
+        for value, (action, _, _) in zip(values, transitions):
+            # if we find a better value
+            if value > best_value:
+                # update the best action to play
+                best_value, best_action = value, action
         # return the action corresponding to the best estimated move
-        _, (action, _, _) = max(
-            enumerate(transitions),
-            key=lambda t: values[t[0]],
-        )
-        # return it
-        return action
+        return best_action
 
     def train(self, n_games: int = 100) -> None:
         """
@@ -198,16 +297,33 @@ class MinMaxPlayer(Player):
 
     def save(self, path: str) -> None:
         """
-        Serialize the current MinMax player's state.
+        Serialize the current MinMax player's state. Only the hash table
+        and the scalar hyperparameters are stored, packed into compressed
+        numpy arrays: pickling the whole __dict__ was both slower and an
+        order of magnitude larger on big tables.
 
         Args:
             path: location where to save the player's state.
 
         Returns: None.
         """
+        # pack the hash table keys into a flat array
+        keys = np.fromiter(self._visited.keys(), dtype=np.int64, count=len(self._visited))
+        # pack the hash table entries into a matrix, encoding None fields as -1
+        entries = np.array(
+            [[-1.0 if field is None else field for field in entry] for entry in self._visited.values()],
+            dtype=np.float64,
+        )
         # serialize the MinMax player
         with open(path, 'wb') as f:
-            pickle.dump(self.__dict__, f)
+            np.savez_compressed(
+                f,
+                keys=keys,
+                entries=entries,
+                depth=self._depth,
+                symmetries=self._symmetries,
+                enhance=self._enhance,
+            )
 
     def load(self, path: str) -> None:
         """
@@ -219,8 +335,30 @@ class MinMaxPlayer(Player):
         Returns: None.
         """
         # load the serialized MinMax player
-        with open(path, 'rb') as f:
-            self.__dict__ = pickle.load(f)
+        with np.load(path) as data:
+            self._depth = int(data['depth'])
+            self.symmetries = bool(data['symmetries'])
+            self._enhance = bool(data['enhance'])
+            keys = data['keys'].tolist()
+            entries = data['entries']
+        # take the number of fields per entry
+        width = entries.shape[1] if entries.size else 0
+        # rebuild the hash table entries
+        if width == 3:
+            # plain Min-Max entries: (depth, value, age)
+            values = [(int(e[0]), e[1], int(e[2])) for e in entries.tolist()]
+        else:
+            # alpha-beta entries: (depth, value, best index, flag, age)
+            values = [
+                (int(e[0]), e[1], None if e[2] < 0 else int(e[2]), int(e[3]), int(e[4])) for e in entries.tolist()
+            ]
+        # rebuild the hash table
+        self._visited = dict(zip(keys, values))
+        # resume from the last stored generation
+        self._age = max((entry[-1] for entry in values), default=0)
+        # reset the per-search caches
+        self._eval_cache = {}
+        self._children_cache = {}
         # disable parallelization
         self._parallelize = False
 
@@ -244,75 +382,287 @@ class AlphaBetaMinMaxPlayer(MinMaxPlayer):
             None.
         """
         super().__init__(depth, symmetries, enhance)
+        # map each remaining depth to the last two actions that caused a cutoff
+        self._killers = {}
+        # map each action to its accumulated cutoff score
+        self._history = MissNoAddDict(int)
+
+    def _order_transitions(
+        self, transitions: list, entry: None | tuple, depth: int, player_id: int, maximize: bool
+    ) -> list[int]:
+        """
+        Order the transitions so that the most promising ones are explored
+        first: the best transition of a shallower search, then the killer
+        moves of the current ply, then the remaining transitions sorted by
+        their history score and static evaluation.
 
-    def max_value(
-        self, game: 'Game', key: int, depth: int, alpha: float, beta: float
-    ) -> tuple[int | float, None | tuple[tuple[int, int], Move]]:
+        Args:
+            transitions: the possible game transitions;
+            entry: the hash table entry of the current state, if any;
+            depth: the remaining depth in the search tree;
+            player_id: the player from whose perspective to evaluate;
+            maximize: whether the best transitions are the highest-valued ones.
+
+        Returns:
+            The indices of the transitions in exploration order are returned.
         """
-        Perform a recursive traversal of the adversarial search tree
-        for the Max player to a maximum depth by cutting off
-        some branches whenever a Min ancestor cannot improve
-        its associated value.
+        # get the killer moves of the current ply
+        killers = self._killers.get(depth, ())
+        # get the history table
+        history = self._history
+        # if the node is deep and wide enough for the static evaluations to pay off
+        if depth > 1 and len(transitions) > 2:
+            # get the evaluation cache
+            eval_cache = self._eval_cache
+            # let the best evaluations come first for either node type
+            sign = 1 if maximize else -1
+
+            def sort_key(i: int) -> tuple:
+                action, state, child_key = transitions[i]
+                # statically evaluate the child, reusing the evaluation cache
+                value = eval_cache.get(child_key)
+                if value is None:
+                    value = state.evaluation_function(player_id, self._enhance)
+                    eval_cache[child_key] = value
+                return (action in killers, history[action], sign * value)
+
+        # otherwise
+        else:
+
+            def sort_key(i: int) -> tuple:
+                action = transitions[i][0]
+                return (action in killers, history[action])
+
+        # sort the transitions by killer moves, history score and static evaluation
+        order = sorted(range(len(transitions)), key=sort_key, reverse=True)
+        # if a shallower search already found a best transition
+        if entry is not None and entry[2] is not None and entry[2] < len(transitions):
+            # explore the principal variation first
+            order.remove(entry[2])
+            order.insert(0, entry[2])
+
+        return order
+
+    def _store_cutoff(self, action: tuple[tuple[int, int], Move], depth: int) -> None:
+        """
+        Remember an action that caused a cutoff so that it is explored
+        earlier in sibling positions.
+
+        Args:
+            action: the action that caused the cutoff;
+            depth: the remaining depth in the search tree.
+
+        Returns:
+            None.
+        """
+        # get the killer moves of the current ply
+        killers = self._killers.setdefault(depth, [None, None])
+        # if the action is not already the first killer move
+        if action != killers[0]:
+            # shift the killer moves
+            killers[1] = killers[0]
+            killers[0] = action
+        # increment the history score of the action
+        self._history[action] += depth * depth
+
+    def _open_node(
+        self, game: 'InvestigateGame', key: int, depth: int, alpha: float, beta: float, maximize: bool
+    ) -> int | float | list:
+        """
+        Probe the hash table and the leaf conditions of a node; when the
+        node has to be expanded instead, build the search frame describing
+        its pending exploration.
 
         Args:
             game: the current game state;
             key: the current game state representation;
             depth: the remaining depth in the search tree;
             alpha: the best value among all Max ancestors;
-            beta: the best value among all Min ancestors.
+            beta: the best value among all Min ancestors;
+            maximize: whether the node plays as Max or as Min.
 
         Returns:
-            The evaluation function value of the best move to play
-            for Max is returned.
+            The value of the node or the frame to push on the search stack
+            is returned.
         """
         # check if the state is already in hash table
-        if key in self._visited and depth <= self._visited[key].depth:
-            return self._visited[key].value
-
+        entry = self._visited.get(key)
+        # if it is deep enough
+        if entry is not None and depth <= entry[0]:
+            value, flag = entry[1], entry[3]
+            # if the value is exact
+            if flag == EXACT:
+                return value
+            # if the value is a lower bound that already triggers a cutoff
+            if flag == LOWER and value >= beta:
+                return value
+            # if the value is an upper bound that cannot improve alpha
+            if flag == UPPER and value <= alpha:
+                return value
+
+        # take the player from whose perspective the node is evaluated
+        player_id = game.current_player_idx if maximize else 1 - game.current_player_idx
+        # check for a winner only once per node
+        winner = game.check_winner() if depth > 0 else None
         # if there are no more levels to examine or we are in a terminal state
-        if depth <= 0 or game.check_winner() != -1:
-            # get the heuristic value
-            value = game.evaluation_function(game.current_player_idx, self._enhance)
+        if winner is None or winner != -1:
+            # get the heuristic value of the state, if already computed
+            value = self._eval_cache.get(key)
+            # if the state has never been evaluated
+            if value is None:
+                # get the heuristic value
+                value = game.evaluation_function(player_id, self._enhance, winner)
+                # save it in the evaluation cache
+                self._eval_cache[key] = value
             # save the state in hash table
-            self._visited[key] = EntryMinMax(0, value)
+            self._visited[key] = (0, value, None, EXACT, self._age)
             # return its heuristic value
             return value
 
-        # set the current best max value
-        best_value = float('-inf')
-        # get all possible game transitions or canonical transitions
-        transitions = (
-            game.generate_canonical_transitions() if self._symmetries else game.generate_possible_transitions()
-        )
-        # for each possible game transition
-        for _, state, key in transitions:
-            # play as Min
-            value = self.min_value(state, key, depth - 1, alpha, beta)
-            # if we find a better value
-            if value > best_value:
-                # update the current max value
-                best_value = value
-                # update the maximum Max value so far
-                alpha = max(alpha, best_value)
-            # if the value for the best Min ancestor cannot be improved
-            if best_value >= beta:
+        # get all possible game transitions or canonical transitions, reusing the cache
+        transitions = self._children_cache.get(key)
+        # if the transitions of this state have not been generated yet
+        if transitions is None:
+            transitions = self._generate_transitions(game)
+            self._children_cache[key] = transitions
+        # order the transitions so that the most promising ones come first
+        order = self._order_transitions(transitions, entry, depth, player_id, maximize)
+        # build the frame: [key, depth, alpha, beta, maximize, transitions, order,
+        # next position to explore, best value, best index, original bound]
+        return [
+            key,
+            depth,
+            alpha,
+            beta,
+            maximize,
+            transitions,
+            order,
+            0,
+            NEG_INF if maximize else INF,
+            None,
+            alpha if maximize else beta,
+        ]
+
+    def _alpha_beta(
+        self, game: 'InvestigateGame', key: int, depth: int, alpha: float, beta: float, maximize: bool
+    ) -> int | float:
+        """
+        Perform an iterative traversal of the adversarial search tree to a
+        maximum depth, cutting off the branches that cannot improve the
+        value of a Max or Min ancestor. An explicit stack of frames replaces
+        the mutual max/min recursion, which removes the interpreter frame
+        construction cost paid on every node.
+
+        Args:
+            game: the current game state;
+            key: the current game state representation;
+            depth: the remaining depth in the search tree;
+            alpha: the best value among all Max ancestors;
+            beta: the best value among all Min ancestors;
+            maximize: whether the root of the traversal plays as Max.
+
+        Returns:
+            The evaluation function value of the best move to play
+            is returned.
+        """
+        # open the root node
+        outcome = self._open_node(game, key, depth, alpha, beta, maximize)
+        # if the root is a leaf or a hash table hit
+        if not isinstance(outcome, list):
+            # return its value directly
+            return outcome
+        # initialize the search stack
+        stack = [outcome]
+        # define the value produced by the last closed node
+        value = None
+        # while there are nodes to explore
+        while stack:
+            # take the frame on top of the stack
+            frame = stack[-1]
+            key, depth, alpha, beta, maximize, transitions, order, position, best_value, best_index, bound = frame
+            # if a child has just produced a value
+            if value is not None:
+                # take the child that produced it
+                i = order[position - 1]
+                # if the node plays as Max
+                if maximize:
+                    # if we find a better value
+                    if value > best_value:
+                        # update the current max value and best transition
+                        frame[8] = best_value = value
+                        frame[9] = best_index = i
+                        # update the maximum Max value so far
+                        if best_value > alpha:
+                            frame[2] = alpha = best_value
+                    # if the value for the best Min ancestor cannot be improved
+                    if best_value >= beta:
+                        # remember the action that caused the cutoff
+                        self._store_cutoff(transitions[i][0], depth)
+                        # save the state in hash table as a lower bound
+                        self._visited[key] = (depth, best_value, best_index, LOWER, self._age)
+                        # close the node and hand its value to the parent
+                        stack.pop()
+                        value = best_value
+                        continue
+                # if the node plays as Min
+                else:
+                    # if we find a better value
+                    if value < best_value:
+                        # update the current min value and best transition
+                        frame[8] = best_value = value
+                        frame[9] = best_index = i
+                        # update the minimum Min value so far
+                        if best_value < beta:
+                            frame[3] = beta = best_value
+                    # if the value for the best Max ancestor cannot be improved
+                    if best_value <= alpha:
+                        # remember the action that caused the cutoff
+                        self._store_cutoff(transitions[i][0], depth)
+                        # save the state in hash table as an upper bound
+                        self._visited[key] = (depth, best_value, best_index, UPPER, self._age)
+                        # close the node and hand its value to the parent
+                        stack.pop()
+                        value = best_value
+                        continue
+                # the value has been consumed
+                value = None
+            # if all the transitions have been explored
+            if position >= len(order):
+                # classify the value bound of the node
+                if maximize:
+                    flag = UPPER if best_value <= bound else EXACT
+                else:
+                    flag = LOWER if best_value >= bound else EXACT
                 # save the state in hash table
-                self._visited[key] = EntryMinMax(depth, best_value)
-                # terminate the search
-                return best_value
+                self._visited[key] = (depth, best_value, best_index, flag, self._age)
+                # close the node and hand its value to the parent
+                stack.pop()
+                value = best_value
+                continue
+            # take the next transition to explore
+            _, state, child_key = transitions[order[position]]
+            frame[7] = position + 1
+            # open the child node
+            outcome = self._open_node(state, child_key, depth - 1, alpha, beta, not maximize)
+            # if the child has to be expanded
+            if isinstance(outcome, list):
+                # push its frame on the stack
+                stack.append(outcome)
+                value = None
+            # otherwise
+            else:
+                # feed its value to the current node
+                value = outcome
 
-        # save the state in hash table
-        self._visited[key] = EntryMinMax(depth, best_value)
-        return best_value
+        return value
 
-    def min_value(
+    def max_value(
         self, game: 'Game', key: int, depth: int, alpha: float, beta: float
     ) -> tuple[int | float, None | tuple[tuple[int, int], Move]]:
         """
-        Perform a recursive traversal of the adversarial search tree
-        for the Min player to a maximum depth by cutting off
-        some branches whenever a Max ancestor cannot improve
-        its associated value.
+        Explore the adversarial search tree for the Max player to a maximum
+        depth by cutting off some branches whenever a Min ancestor cannot
+        improve its associated value.
 
         Args:
             game: the current game state;
@@ -323,51 +673,38 @@ class AlphaBetaMinMaxPlayer(MinMaxPlayer):
 
         Returns:
             The evaluation function value of the best move to play
-            for Min is returned.
+            for Max is returned.
         """
-        # check if the state is already in hash table
-        if key in self._visited and depth <= self._visited[key].depth:
-            return self._visited[key].value
+        return self._alpha_beta(game, key, depth, alpha, beta, maximize=True)
 
-        # if there are no more levels to examine or we are in a terminal state
-        if depth <= 0 or game.check_winner() != -1:
-            # get the heuristic value
-            value = game.evaluation_function(1 - game.current_player_idx, self._enhance)
-            # save the state in hash table
-            self._visited[key] = EntryMinMax(0, value)
-            # return its heuristic value
-            return value
+    def min_value(
+        self, game: 'Game', key: int, depth: int, alpha: float, beta: float
+    ) -> tuple[int | float, None | tuple[tuple[int, int], Move]]:
+        """
+        Explore the adversarial search tree for the Min player to a maximum
+        depth by cutting off some branches whenever a Max ancestor cannot
+        improve its associated value.
 
-        # set the current best min value
-        best_value = float('inf')
-        # get all possible game transitions or canonical transitions
-        transitions = (
-            game.generate_canonical_transitions() if self._symmetries else game.generate_possible_transitions()
-        )
-        # for each possible game transition
-        for _, state, key in transitions:
-            # play as Max
-            value = self.max_value(state, key, depth - 1, alpha, beta)
-            # if we find a better value
-            if value < best_value:
-                # update the current min value
-                best_value = value
-                # update the minimum Min value so far
-                beta = min(beta, best_value)
-            # if the value for the best Max ancestor cannot be improved
-            if best_value <= alpha:
-                # save the state in hash table
-                self._visited[key] = EntryMinMax(depth, best_value)
-                # terminate the search
-                return best_value
+        Args:
+            game: the current game state;
+            key: the current game state representation;
+            depth: the remaining depth in the search tree;
+            alpha: the best value among all Max ancestors;
+            beta: the best value among all Min ancestors.
 
-        # save the state in hash table
-        self._visited[key] = EntryMinMax(depth, best_value)
-        return best_value
+        Returns:
+            The evaluation function value of the best move to play
+            for Min is returned.
+        """
+        return self._alpha_beta(game, key, depth, alpha, beta, maximize=False)
 
     def make_move(self, game: 'Game') -> tuple[int | float, None | tuple[tuple[int, int], Move]]:
         """
         Implement the MinMax procedure with alpha-beta pruning.
+        The search is repeated with iterative deepening from depth 1 up to
+        the maximum depth: before each iteration the root transitions are
+        sorted by the values of the previous iteration, so that the
+        principal variation is explored first and pruning is more effective.
 
         Args:
             game: the current game state.
@@ -375,32 +712,62 @@ class AlphaBetaMinMaxPlayer(MinMaxPlayer):
         Returns:
             The best move to play for Max is returned.
         """
+        # start a new search generation
+        self._new_generation()
         # create seperate instance of a game for investigation
         game = InvestigateGame(game)
         # get all possible game transitions or canonical transitions
         transitions = game.generate_canonical_transitions()
-        # if we are parallelizing
-        if self._parallelize:
-            # parallelize min_value
-            values = Parallel(n_jobs=-1)(
-                delayed(self.min_value)(state, key, self._depth - 1, float('-inf'), float('inf'))
-                for _, state, key in transitions
-            )
-        # otherwise
-        else:
-            # do not parallelize
-            values = [
-                self.min_value(state, key, self._depth - 1, float('-inf'), float('inf'))
-                for _, state, key in transitions
-            ]
+        # define the values of the root transitions
+        values = [0] * len(transitions)
+        # define the best action found so far
+        best_action = None
+        # for each iterative deepening depth
+        for depth in range(1, self._depth + 1):
+            # explore the best transitions of the previous iteration first
+            order = sorted(range(len(transitions)), key=values.__getitem__, reverse=True)
+            transitions = [transitions[i] for i in order]
+            # if we are parallelizing
+            if self._parallelize:
+                # search the most promising transition serially to seed a real bound
+                best_action, first_state, first_key = transitions[0]
+                best_value = self.min_value(first_state, first_key, depth - 1, NEG_INF, INF)
+                # parallelize min_value on the remaining transitions under the
+                # seeded window (the workers cannot share a narrowing bound)
+                rest = Parallel(n_jobs=-1)(
+                    delayed(self.min_value)(state, key, depth - 1, best_value, INF)
+                    for _, state, key in transitions[1:]
+                )
+                # keep the values of the whole iteration for the next re-ordering
+                values = [best_value] + list(rest)
+                # for each remaining root transition and its value
+                for value, (action, _, _) in zip(rest, transitions[1:]):
+                    # if we find a better value
+                    if value > best_value:
+                        # update the best action to play
+                        best_value, best_action = value, action
+            # otherwise
+            else:
+                # define the best value found so far
+                best_value = NEG_INF
+                # define the window lower bound shared by the root transitions
+                alpha = NEG_INF
+                # define the values of the current iteration
+                values = []
+                # for each root transition
+                for action, state, key in transitions:
+                    # play as Min under the narrowing window
+                    value = self.min_value(state, key, depth - 1, alpha, INF)
+                    values.append(value)
+                    # if we find a better value
+                    if value > best_value:
+                        # update the best action to play
+                        best_value, best_action = value, action
+                        # let the best value so far prune the remaining siblings
+                        alpha = value
 
         # return the action corresponding to the best estimated move
-        _, (action, _, _) = max(
-            enumerate(transitions),
-            key=lambda t: values[t[0]],
-        )
-        # return it
-        return action
+        return best_action
 
 
 if __name__ == "__main__":
@@ -429,7 +796,7 @@ if __name__ == "__main__":
         for flag1, flag2 in [(False,True),(True,True),(False,False),(True,False),]:
             # set flags
             player.parallelize(flag1)
-            player._symmetries = flag2
+            player.symmetries = flag2
             # create the game
             game = Game()
             # take a start time
@@ -1,14 +1,52 @@
 from game import Game, Move, Player
 from typing import Literal
+from array import array
 import numpy as np
-import pickle
 import math
 from random import random, choice
 from tqdm import trange
 from players.random_player import RandomPlayer
-from utils.investigate_game import InvestigateGame, MissNoAddDict
+from utils.investigate_game import InvestigateGame
+from utils.hash_table import HashTable
 from players.min_max import AlphaBetaMinMaxPlayer
 
+try:
+    # numba is optional: if it is available the state-value update kernel is compiled
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rollout_state_values(state_values: np.ndarray, reward: float, alpha: float, gamma: float) -> np.ndarray:
+    '''
+    Walk a trajectory backwards and apply the Monte Carlo update rule
+    to the gathered state values, in place.
+
+    Args:
+        state_values: the current values of the trajectory states;
+        reward: the final reward of the game;
+        alpha: how much information to incorporate from the new experience;
+        gamma: the discount rate.
+
+    Returns:
+        The updated state values are returned.
+    '''
+    # define the return of rewards
+    return_of_rewards = reward
+    # for each state value, from the last to the first
+    for i in range(state_values.shape[0] - 1, -1, -1):
+        # update the state value
+        state_values[i] = state_values[i] + alpha * (gamma * return_of_rewards - state_values[i])
+        return_of_rewards = state_values[i]
+
+    return state_values
+
+
+# if numba is available
+if njit is not None:
+    # compile the state-value update kernel ahead of the trainings
+    _rollout_state_values = njit(cache=True)(_rollout_state_values)
+
 
 class MonteCarloRLPlayer(Player):
     """
@@ -37,7 +75,7 @@ class MonteCarloRLPlayer(Player):
             None.
         """
         super().__init__()
-        self._state_values = MissNoAddDict(float)  # define the State-Value function
+        self._state_values = HashTable()  # define the State-Value function
         self._n_episodes = n_episodes  # define the number of episodes for the training phase
         self._gamma = gamma  # define the discount rate
         self._alpha = alpha  # define how much information to incorporate from the new experience
@@ -48,7 +86,8 @@ class MonteCarloRLPlayer(Player):
         self._exploration_decay_rate = (
             exploration_decay_rate  # define the exploration decay rate used during the training
         )
-        self._rewards = []  # list of the rewards obtained during training
+        self._rewards = array('b')  # rewards obtained during training, one signed byte each
+        self._scratch = InvestigateGame(Game())  # reusable scratch game for make_move
 
     @property
     def rewards(self) -> list[int]:
@@ -96,15 +135,26 @@ class MonteCarloRLPlayer(Player):
         Returns:
             None.
         """
-        # define the return of rewards
-        return_of_rewards = reward
-        # for each state in the trajectory
-        for state_repr_index in reversed(trajectory):
-            # update the State-Value mapping table
-            self._state_values[state_repr_index] = self._state_values[state_repr_index] + self._alpha * (
-                self._gamma * return_of_rewards - self._state_values[state_repr_index]
-            )
-            return_of_rewards = self._state_values[state_repr_index]
+        # if a state appears more than once, each update must observe the previous one
+        if len(set(trajectory)) != len(trajectory):
+            # define the return of rewards
+            return_of_rewards = reward
+            # for each state in the trajectory
+            for state_repr_index in reversed(trajectory):
+                # update the State-Value mapping table
+                self._state_values[state_repr_index] = self._state_values[state_repr_index] + self._alpha * (
+                    self._gamma * return_of_rewards - self._state_values[state_repr_index]
+                )
+                return_of_rewards = self._state_values[state_repr_index]
+            return
+
+        # gather the current values of the trajectory states
+        state_values = np.array([self._state_values[state_repr_index] for state_repr_index in trajectory])
+        # apply the update rule to the whole trajectory in one (possibly compiled) pass
+        state_values = _rollout_state_values(state_values, reward, self._alpha, self._gamma)
+        # write the updated values back into the State-Value mapping table
+        for state_repr_index, state_value in zip(trajectory, state_values):
+            self._state_values[state_repr_index] = float(state_value)
 
     def _step_training(
         self,
@@ -123,7 +173,7 @@ class MonteCarloRLPlayer(Player):
         """
 
         # get all possible canonical transitions
-        transitions = game.generate_canonical_transitions(player_id)
+        transitions = game.generate_canonical_transitions()
 
         # randomly perform exploration
         if random() < self._exploration_rate:
@@ -131,8 +181,10 @@ class MonteCarloRLPlayer(Player):
             transition = choice(transitions)
         # perform eploitation, otherwise
         else:
+            # look up the return of rewards of each resulting state in a single pass
+            state_values = [self._state_values[state_repr_index] for _, _, state_repr_index in transitions]
             # take the action with maximum return of rewards
-            transition = max(transitions, key=lambda t: self._state_values[t[2]])
+            transition = transitions[max(range(len(state_values)), key=state_values.__getitem__)]
 
         return transition
 
@@ -146,12 +198,24 @@ class MonteCarloRLPlayer(Player):
         Returns:
             A move to play is returned.
         """
-        # create seperate instance of a game for investigation
-        game = InvestigateGame(game)
+        # reuse the scratch instance instead of allocating a fresh investigation copy
+        scratch = self._scratch
+        # copy the board into the scratch buffer (the int8 cast is a safe same-kind copy)
+        np.copyto(scratch._board, game._board)
+        # align the moving player
+        scratch.current_player_idx = game.current_player_idx
         # get all possible canonical transitions
-        transitions = game.generate_canonical_transitions()
-        # take the action with maximum return of rewards
-        action, _, _ = max(transitions, key=lambda t: self._state_values[t[2]])
+        transitions = scratch.generate_canonical_transitions()
+        # look up the return of rewards of each resulting state in a single pass
+        state_values = [self._state_values[state_repr_index] for _, _, state_repr_index in transitions]
+        # if at least one resulting state has a learned value (any() stops at the first one)
+        if any(state_values):
+            # take the action with maximum return of rewards
+            action, _, _ = transitions[max(range(len(state_values)), key=state_values.__getitem__)]
+        # if the State-Value function has nothing to say, otherwise
+        else:
+            # any action is as good as any other
+            action, _, _ = choice(transitions)
 
         # return the action
         return action
@@ -179,11 +243,22 @@ class MonteCarloRLPlayer(Player):
         pbar_episodes = trange(self._n_episodes)
         # define the players
         players = self, RandomPlayer()
-
-        # if we want to play also against minmax
-        if self._minmax:
-            # define a new players tuple
-            new_players = self, opponent
+        # define the players to face after the switch moment
+        new_players = self, opponent
+        # define the episode at which we should switch opponent
+        switch_episode = int(switch_ratio * self._n_episodes)
+        # running sum of the last 1_000 rewards shown in the progress bar
+        last_rewards_sum = sum(self._rewards[-1_000:])
+        # bind the hot lookups once: every self.attr in the episode loop is a
+        # dict lookup that a local variable avoids
+        state_values = self._state_values
+        rewards = self._rewards
+        step_training = self._step_training
+        game_reward = self._game_reward
+        update_state_values = self._update_state_values
+        min_exploration_rate = self._min_exploration_rate
+        exploration_decay_rate = self._exploration_decay_rate
+        exp = math.exp
 
         # for each episode
         for episode in pbar_episodes:
@@ -191,7 +266,7 @@ class MonteCarloRLPlayer(Player):
             game = InvestigateGame(Game())
 
             # switch the players if it is the moment
-            if math.isclose(switch_ratio, episode / self._n_episodes):
+            if episode == switch_episode:
                 players = new_players
 
             # define the trajectory
@@ -213,12 +288,14 @@ class MonteCarloRLPlayer(Player):
             while winner < 0 and counter < max_steps_draw:
                 # change player
                 player_idx = (player_idx + 1) % 2
+                # keep the game's moving player in sync with the loop
+                game.current_player_idx = player_idx
                 player = players[player_idx]
 
                 # if it is our turn
                 if self == player:
                     # get an action
-                    action, game, state_repr_index = self._step_training(game, player_idx)
+                    action, game, state_repr_index = step_training(game, player_idx)
 
                     # update the trajectory
                     trajectory.append(state_repr_index)
@@ -250,21 +327,27 @@ class MonteCarloRLPlayer(Player):
                 # check if there is a winner
                 winner = game.check_winner()
 
-            # update the exploration rate
-            self._exploration_rate = np.clip(
-                np.exp(-self._exploration_decay_rate * episode), self._min_exploration_rate, 1
-            )
+            # update the exploration rate (exp(-x) is at most 1, so only the lower clamp is needed)
+            self._exploration_rate = max(exp(-exploration_decay_rate * episode), min_exploration_rate)
 
             # get the game reward
-            reward = self._game_reward(player, winner)
+            reward = game_reward(player, winner)
             # update the rewards history
-            self._rewards.append(reward)
+            rewards.append(reward)
+            # update the running sum of the last 1_000 rewards
+            last_rewards_sum += reward
+            # if the window is full
+            if len(rewards) > 1_000:
+                # drop the reward that slid out of the window
+                last_rewards_sum -= rewards[-1_001]
             # update the State-Value function
-            self._update_state_values(trajectory, reward)
+            update_state_values(trajectory, reward)
 
-            pbar_episodes.set_description(
-                f"# last 1_000 episodes mean reward: {sum(self._rewards[-1_000:]) / 1_000:.2f} - # explored states: {len(self._state_values):,} - Current exploration rate: {self._exploration_rate:2f}"
-            )
+            # refresh the description sparingly: rendering it every episode is pure overhead
+            if episode % 100 == 0:
+                pbar_episodes.set_description(
+                    f"# last 1_000 episodes mean reward: {last_rewards_sum / 1_000:.2f} - # explored states: {len(state_values):,} - Current exploration rate: {self._exploration_rate:2f}"
+                )
 
         print(f'** Last 1_000 episodes - Mean rewards value: {sum(self._rewards[-1_000:]) / 1_000:.2f} **')
         print(f'** Last rewards value: {self._rewards[-1]:} **')
@@ -278,9 +361,26 @@ class MonteCarloRLPlayer(Player):
 
         Returns: None.
         """
-        # serialize the Monte Carlo learning player
+        # export the State-Value table as two dense arrays
+        keys, values = self._state_values.to_arrays()
+        # pack the scalar parameters together
+        parameters = np.array(
+            [
+                self._n_episodes,
+                self._gamma,
+                self._alpha,
+                self._exploration_rate,
+                self._min_exploration_rate,
+                self._exploration_decay_rate,
+            ]
+        )
+        # serialize the Monte Carlo learning player as raw arrays instead of
+        # pickling millions of boxed entries (save to an already opened file
+        # so that the exact path is honored)
         with open(path, 'wb') as f:
-            pickle.dump(self.__dict__, f)
+            np.savez_compressed(
+                f, keys=keys, values=values, rewards=np.asarray(self._rewards), parameters=parameters
+            )
 
     def load(self, path: str) -> None:
         """
@@ -293,7 +393,19 @@ class MonteCarloRLPlayer(Player):
         """
         # load the serialized Monte Carlo learning player
         with open(path, 'rb') as f:
-            self.__dict__ = pickle.load(f)
+            data = np.load(f)
+            # rebuild the State-Value table from the dense arrays
+            self._state_values = HashTable.from_arrays(data['keys'], data['values'])
+            # restore the rewards history
+            self._rewards = array('b', data['rewards'].tolist())
+            # unpack the scalar parameters
+            parameters = data['parameters']
+        self._n_episodes = int(parameters[0])
+        self._gamma = float(parameters[1])
+        self._alpha = float(parameters[2])
+        self._exploration_rate = float(parameters[3])
+        self._min_exploration_rate = float(parameters[4])
+        self._exploration_decay_rate = float(parameters[5])
 
 
 if __name__ == '__main__':
@@ -1,5 +1,6 @@
-from random import randint, choice
+from random import choice
 from game import Game, Move, Player
+from utils.investigate_game import POSSIBLE_MOVES
 
 
 class RandomPlayer(Player):
@@ -21,7 +22,8 @@ class RandomPlayer(Player):
 
     def make_move(self, game: 'Game') -> tuple[tuple[int, int], Move]:
         """
-        Select a random move to play.
+        Select a random move to play among the legal ones, so that the
+        caller never has to reject the choice and ask for another one.
 
         Args:
             game: the current game state.
@@ -29,7 +31,16 @@ class RandomPlayer(Player):
         Return:
             A random move is returned.
         """
-        board = game.get_board()
-        from_pos = (randint(0, board.shape[1] - 1), randint(0, board.shape[0] - 1))
-        move = choice([Move.TOP, Move.BOTTOM, Move.LEFT, Move.RIGHT])
-        return from_pos, move
+        # take the board once
+        board = game._board
+        # take the moving player
+        player_id = game.current_player_idx
+        # choose among the legal candidates only: a piece can be taken
+        # if it is neutral or already owned by the moving player
+        return choice(
+            [
+                (from_pos, slide)
+                for from_pos, slide in POSSIBLE_MOVES
+                if board[from_pos[1], from_pos[0]] != 1 - player_id
+            ]
+        )
@@ -0,0 +1,201 @@
+import numpy as np
+
+try:
+    # numba is optional: if it is available the probing kernel is compiled
+    from numba import njit
+except ImportError:
+    njit = None
+
+# sentinel marking an empty slot: state keys are XORs of non-negative 63-bit
+# Zobrist numbers, so they can never be negative
+EMPTY = -1
+
+
+def _probe(keys: np.ndarray, key: int, mask: int) -> int:
+    '''
+    Find the slot of a key by linear probing.
+
+    Args:
+        keys: the keys array of the table;
+        key: the key to look for;
+        mask: the bitmask reducing a key to a slot index.
+
+    Returns:
+        The index of the slot holding the key, or of the empty
+        slot where it would be inserted, is returned.
+    '''
+    # reduce the key to its home slot
+    i = key & mask
+    # while the slot is taken by another key
+    while keys[i] != EMPTY and keys[i] != key:
+        # move on to the next slot
+        i = (i + 1) & mask
+
+    return i
+
+
+# if numba is available
+if njit is not None:
+    # compile the probing kernel ahead of the lookups
+    _probe = njit(cache=True)(_probe)
+
+
+class HashTable:
+    '''
+    Class representing an open-addressing hash table mapping 64-bit integer
+    keys to float values. Keys and values live in two dense NumPy arrays,
+    so each entry costs 12 bytes instead of a full dict slot plus a boxed
+    float. As with MissNoAddDict, reading a missing key returns the default
+    value without inserting it.
+    '''
+
+    def __init__(self, capacity: int = 2**16) -> None:
+        '''
+        Constructor of the hash table.
+
+        Args:
+            capacity: the initial number of slots, rounded up to a power of two.
+
+        Returns:
+            None.
+        '''
+        # round the capacity up to a power of two so that probing can use a bitmask
+        capacity = 1 << (capacity - 1).bit_length()
+        # define the keys array, all slots empty
+        self._keys = np.full(capacity, EMPTY, dtype=np.int64)
+        # define the values array
+        self._values = np.zeros(capacity, dtype=np.float32)
+        # define the number of taken slots
+        self._used = 0
+
+    def __len__(self) -> int:
+        '''
+        Get the number of entries in the table.
+
+        Args:
+            None.
+
+        Returns:
+            The number of entries is returned.
+        '''
+        return self._used
+
+    def __contains__(self, key: int) -> bool:
+        '''
+        Check whether a key is present in the table.
+
+        Args:
+            key: the key to look for.
+
+        Returns:
+            The presence of the key is returned.
+        '''
+        return self._keys[_probe(self._keys, key, self._keys.shape[0] - 1)] != EMPTY
+
+    def __getitem__(self, key: int) -> float:
+        '''
+        Get the value of a key, or the default value if the key
+        is missing. The missing key is not inserted.
+
+        Args:
+            key: the key to look for.
+
+        Returns:
+            The value of the key is returned.
+        '''
+        # find the slot of the key
+        i = _probe(self._keys, key, self._keys.shape[0] - 1)
+        # if the key is missing return the default value, otherwise return the slot value
+        return 0.0 if self._keys[i] == EMPTY else float(self._values[i])
+
+    def __setitem__(self, key: int, value: float) -> None:
+        '''
+        Set the value of a key, inserting the key if it is missing.
+
+        Args:
+            key: the key to update;
+            value: the value to store.
+
+        Returns:
+            None.
+        '''
+        # find the slot of the key
+        i = _probe(self._keys, key, self._keys.shape[0] - 1)
+        # if the key is missing
+        if self._keys[i] == EMPTY:
+            # take the slot
+            self._keys[i] = key
+            # update the number of taken slots
+            self._used += 1
+        # store the value
+        self._values[i] = value
+        # if the table is more than 2/3 full
+        if 3 * self._used > 2 * self._keys.shape[0]:
+            # double its capacity
+            self._grow()
+
+    def to_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Export the entries as a pair of dense arrays, without the empty slots.
+
+        Args:
+            None.
+
+        Returns:
+            The keys and values arrays of the entries are returned.
+        '''
+        # take the slots that are actually taken
+        taken = self._keys != EMPTY
+
+        return self._keys[taken], self._values[taken]
+
+    @classmethod
+    def from_arrays(cls, keys: np.ndarray, values: np.ndarray) -> 'HashTable':
+        '''
+        Rebuild a table from the arrays produced by to_arrays.
+
+        Args:
+            keys: the keys of the entries;
+            values: the values of the entries.
+
+        Returns:
+            The rebuilt table is returned.
+        '''
+        # size the table so that the entries fit below the 2/3 load bound
+        table = cls(capacity=max(2 * keys.shape[0], 2**16))
+        # for each entry
+        for key, value in zip(keys, values):
+            # find its slot
+            i = _probe(table._keys, key, table._keys.shape[0] - 1)
+            # insert it
+            table._keys[i] = key
+            table._values[i] = value
+        # update the number of taken slots
+        table._used = keys.shape[0]
+
+        return table
+
+    def _grow(self) -> None:
+        '''
+        Double the capacity of the table and re-insert every entry.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        '''
+        # keep the old arrays
+        old_keys, old_values = self._keys, self._values
+        # double the number of slots
+        capacity = old_keys.shape[0] * 2
+        # allocate the new arrays
+        self._keys = np.full(capacity, EMPTY, dtype=np.int64)
+        self._values = np.zeros(capacity, dtype=np.float32)
+        # for each old entry
+        for key, value in zip(old_keys[old_keys != EMPTY], old_values[old_keys != EMPTY]):
+            # find its new slot
+            i = _probe(self._keys, key, capacity - 1)
+            # re-insert it
+            self._keys[i] = key
+            self._values[i] = value
@@ -1,11 +1,16 @@
 from game import Game, Move, Player
-from copy import deepcopy
 from itertools import product
 from typing import Literal, Any
 from utils.symmetry import Symmetry
 import numpy as np
 from collections import defaultdict
 
+try:
+    # numba is optional: if it is available the bitboard kernel is compiled
+    from numba import njit
+except ImportError:
+    njit = None
+
 POSSIBLE_MOVES = []
 # for each piece position
 for from_pos in set(product([0, 4], range(Game()._board.shape[0]))).union(
@@ -16,7 +21,7 @@ for from_pos in set(product([0, 4], range(Game()._board.shape[0]))).union(
     # for each slide
     for slide in slides:
         # make a copy of the current game state
-        state = deepcopy(Game())
+        state = Game()
         # create an action
         action = (from_pos, slide)
         # perfom the action (note: _Game__move is necessary due to name mangling)
@@ -26,6 +31,82 @@ for from_pos in set(product([0, 4], range(Game()._board.shape[0]))).union(
             # append to the list of possible moves
             POSSIBLE_MOVES.append(action)
 
+# flattened index of the source cell of each possible move, used to
+# validate all the candidates with a single vectorized gather
+MOVE_CELL_INDICES = np.array([from_pos[1] * 5 + from_pos[0] for from_pos, _ in POSSIBLE_MOVES])
+
+# seeded generator so that the Zobrist keys are stable across runs and processes
+_zobrist_rng = np.random.default_rng(seed=0xC0FFEE)
+# random 64-bit number for each (cell, symbol) pair
+ZOBRIST_BOARD = _zobrist_rng.integers(0, 2**63, size=(25, 3), dtype=np.int64)
+# random 64-bit number for each moving player
+ZOBRIST_PLAYER = _zobrist_rng.integers(0, 2**63, size=2, dtype=np.int64)
+# indices of the board cells used to look up the Zobrist numbers
+CELL_INDICES = np.arange(25)
+
+# flattened cell index permutations of the 8 board symmetries, in the
+# transformation order documented by the Symmetry class
+_index_grid = np.arange(25).reshape(5, 5)
+SYMMETRY_PERMUTATIONS = np.array(
+    # take the identity and the three rotations
+    [np.rot90(_index_grid, k=k).ravel() for k in range(4)]
+    # take the up/down flip and its three rotations
+    + [np.rot90(np.flipud(_index_grid), k=k).ravel() for k in range(4)]
+)
+# lookup table swapping the two players in the shifted {0, 1, 2} cell encoding
+SWAP_SYMBOLS = np.array([0, 2, 1])
+
+# cache of already computed canonical representations keyed by (board bytes, player id)
+_canonical_cache = {}
+# maximum number of entries kept in the canonical representations cache
+_CANONICAL_CACHE_SIZE = 2**20
+
+LINE_MASKS = tuple(
+    # take the masks of all rows
+    [sum(1 << (y * 5 + x) for x in range(5)) for y in range(5)]
+    # take the masks of all columns
+    + [sum(1 << (y * 5 + x) for y in range(5)) for x in range(5)]
+    # take the mask of the principal diagonal
+    + [sum(1 << (y * 5 + y) for y in range(5))]
+    # take the mask of the secondary diagonal
+    + [sum(1 << (y * 5 + (4 - y)) for y in range(5))]
+)
+
+
+def _board_to_bitboards(cells: np.ndarray) -> tuple[int, int]:
+    '''
+    Pack the flattened board cells into one 25-bit integer bitboard per player.
+
+    Args:
+        cells: the flattened board cells.
+
+    Returns:
+        The bitboards of player 0 and player 1 are returned.
+    '''
+    # define the bitboards of the two players
+    bitboard_0 = 0
+    bitboard_1 = 0
+    # for each board cell
+    for i in range(25):
+        # take the cell symbol
+        cell = cells[i]
+        # if the piece is taken by player 0
+        if cell == 0:
+            # set the corresponding bit on its bitboard
+            bitboard_0 |= 1 << i
+        # if the piece is taken by player 1
+        elif cell == 1:
+            # set the corresponding bit on its bitboard
+            bitboard_1 |= 1 << i
+
+    return bitboard_0, bitboard_1
+
+
+# if numba is available
+if njit is not None:
+    # compile the bitboard kernel ahead of the searches
+    _board_to_bitboards = njit(cache=True)(_board_to_bitboards)
+
 
 class MissNoAddDict(defaultdict):
     """
@@ -63,7 +144,8 @@ class InvestigateGame(Game):
             None.
         '''
         super().__init__()
-        self._board = game.get_board()
+        # the cells only hold {-1, 0, 1}, so int8 halves the board's memory traffic
+        self._board = game._board.astype(np.int8)
         self.current_player_idx = game.get_current_player()
         self._player_to_symbol = {-1: '⬜️', 0: '❌', 1: '⭕️'}
 
@@ -87,6 +169,31 @@ class InvestigateGame(Game):
             # go to the beginning of the next line
             print()
 
+    def check_winner(self) -> int:
+        '''
+        Check the winner on the bitboards: a single masked comparison
+        per line replaces the elementwise numpy scans of the base class.
+
+        Args:
+            None.
+
+        Returns:
+            The player ID of the winner if any, otherwise -1 is returned.
+        '''
+        # get the bitboards of the two players
+        bitboard_0, bitboard_1 = self.get_bitboards()
+        # for each board line
+        for mask in LINE_MASKS:
+            # if player 0 has completed the line
+            if bitboard_0 & mask == mask:
+                # return the relative id
+                return 0
+            # if player 1 has completed the line
+            if bitboard_1 & mask == mask:
+                # return the relative id
+                return 1
+        return -1
+
     def __eq__(self, other: 'InvestigateGame') -> bool:
         '''
         Equality check for the class. Games are equal if the boards are equal.
@@ -99,6 +206,29 @@ class InvestigateGame(Game):
         '''
         return (self._board == other._board).all()
 
+    def clone(self) -> 'InvestigateGame':
+        '''
+        Make a copy of the game without going through deepcopy: a move can
+        only mutate the board and the moving player index, so the board is
+        the only field that needs a fresh buffer.
+
+        Args:
+            None.
+
+        Returns:
+            A copy of the game is returned.
+        '''
+        # allocate an instance without re-running the constructor
+        state = object.__new__(type(self))
+        # copy the board, the only mutable buffer
+        state._board = self._board.copy()
+        # copy the moving player index
+        state.current_player_idx = self.current_player_idx
+        # the symbol mapping is never mutated, share it
+        state._player_to_symbol = self._player_to_symbol
+
+        return state
+
     def get_hashable_state(self, player_id: int) -> int:
         '''
         Get a unique representation of a state that can be used as a key for a dictionary.
@@ -109,8 +239,70 @@ class InvestigateGame(Game):
         Returns:
             An integer representation of the state is returned.
         '''
-        # map the game state to an integer in base 3
-        return int(''.join(str(_) for _ in (self._board + 1).flatten()) + str(player_id), base=3)
+        # xor together the Zobrist numbers of each (cell, symbol) pair and of the moving player
+        return int(np.bitwise_xor.reduce(ZOBRIST_BOARD[CELL_INDICES, (self._board + 1).ravel()]) ^ ZOBRIST_PLAYER[player_id])
+
+    def get_canonical_state(self, player_id: int) -> int:
+        '''
+        Get the canonical representation of the state, i.e., the minimum
+        hashable representation over all its symmetric equivalents: the 8
+        transformations of the board, each combined with the swap of the
+        two players. Everything is computed with integer permutation
+        tables and Zobrist numbers, without copying any game instance.
+
+        Args:
+            player_id: the player's id.
+
+        Returns:
+            The canonical integer representation of the state is returned.
+        '''
+        # the canonical representation is a pure function of the board and the moving player
+        cache_key = (self._board.tobytes(), player_id)
+        # look up an already computed canonical representation
+        canonical_state = _canonical_cache.get(cache_key)
+        # if the representation is already known
+        if canonical_state is not None:
+            # reuse it without enumerating the symmetries again
+            return canonical_state
+
+        # shift the board cells into the {0, 1, 2} symbol encoding
+        symbols = (self._board + 1).ravel()
+        # gather all 8 symmetric variants of the board at once as a (8, 25) tensor
+        transformed_symbols = symbols[SYMMETRY_PERMUTATIONS]
+        # stack the same variants with the players swapped, giving 16 symbol rows
+        all_symbols = np.concatenate((transformed_symbols, SWAP_SYMBOLS[transformed_symbols]))
+        # hash every variant in a single vectorized pass
+        transformed_states = np.bitwise_xor.reduce(ZOBRIST_BOARD[CELL_INDICES, all_symbols], axis=1)
+        # fold the moving player into the plain variants
+        transformed_states[:8] ^= ZOBRIST_PLAYER[player_id]
+        # the swapped variants are seen from the other player's perspective
+        transformed_states[8:] ^= ZOBRIST_PLAYER[1 - player_id]
+
+        # take the canonical representation of the whole symmetry orbit
+        canonical_state = int(transformed_states.min())
+        # if the cache has grown too large
+        if len(_canonical_cache) >= _CANONICAL_CACHE_SIZE:
+            # drop it entirely and start over
+            _canonical_cache.clear()
+        # remember the canonical representation of this state
+        _canonical_cache[cache_key] = canonical_state
+
+        return canonical_state
+
+    def get_bitboards(self) -> tuple[int, int]:
+        '''
+        Pack the board into one 25-bit integer bitboard per player.
+        The i-th bit of a player's bitboard is set if the player has
+        taken the piece in position (i // 5, i % 5).
+
+        Args:
+            None.
+
+        Returns:
+            The bitboards of player 0 and player 1 are returned.
+        '''
+        # pack the board cells with the (possibly compiled) kernel
+        return _board_to_bitboards(self._board.ravel())
 
     def generate_possible_transitions(self) -> list[tuple[tuple[tuple[int, int], Move], 'InvestigateGame']]:
         '''
@@ -125,23 +317,24 @@ class InvestigateGame(Game):
         '''
         # define a list of possible transitions
         transitions = []
-        # for each piece position
-        for from_pos, slide in POSSIBLE_MOVES:
-            # check the validity of the action
-            ok = (
-                self._board[from_pos[1], from_pos[0]] == -1
-                or self._board[from_pos[1], from_pos[0]] == self.current_player_idx
-            )
-            # if it is a valid action
-            if ok:
-                # make a copy of the current game state
-                state = deepcopy(self)
-                # perfom the action (note: _Game__move is necessary due to name mangling)
-                state._Game__move(from_pos, slide, self.current_player_idx)
-                # update the current player index
-                state.current_player_idx = 1 - state.current_player_idx
-                # append to the list of possible transitions
-                transitions.append(((from_pos, slide), state, state.get_hashable_state(self.current_player_idx)))
+        # bind the hot lookups once
+        player_id = self.current_player_idx
+        # take the source cell of every candidate move in one gather
+        cells = self._board.ravel()[MOVE_CELL_INDICES]
+        # a piece can be taken if its cell is neutral or already owned by the moving player
+        valid = (cells == -1) | (cells == player_id)
+        # for each valid action
+        for index in np.flatnonzero(valid):
+            # take the action
+            from_pos, slide = POSSIBLE_MOVES[index]
+            # make a copy of the current game state
+            state = self.clone()
+            # perfom the action (note: _Game__move is necessary due to name mangling)
+            state._Game__move(from_pos, slide, player_id)
+            # update the current player index
+            state.current_player_idx = 1 - player_id
+            # append to the list of possible transitions
+            transitions.append(((from_pos, slide), state, state.get_hashable_state(player_id)))
 
         return transitions
 
@@ -162,33 +355,34 @@ class InvestigateGame(Game):
         transitions = []
         # define a set of canonical states
         canonical_states = set()
-        # for each piece position
-        for from_pos, slide in POSSIBLE_MOVES:
-            # check the validity of the action
-            ok = (
-                self._board[from_pos[1], from_pos[0]] == -1
-                or self._board[from_pos[1], from_pos[0]] == self.current_player_idx
-            )         
-            # if it is a valid action
-            if ok:
-                # make a copy of the current game state
-                state = deepcopy(self)
-                # perfom the action (note: _Game__move is necessary due to name mangling)
-                state._Game__move(from_pos, slide, self.current_player_idx)
-                # get the equivalent canonical state
-                canonical_state = Symmetry.get_canonical_state(state, self.current_player_idx)
-                # if it is a new canonical state
-                if canonical_state not in canonical_states:
-                    # update the current player index
-                    state.current_player_idx = 1 - state.current_player_idx
-                    # append to the list of possible transitions
-                    transitions.append(((from_pos, slide), state, canonical_state))
-                    # appens to the list of canonical states
-                    canonical_states.add(canonical_state)
+        # bind the hot lookups once
+        player_id = self.current_player_idx
+        # take the source cell of every candidate move in one gather
+        cells = self._board.ravel()[MOVE_CELL_INDICES]
+        # a piece can be taken if its cell is neutral or already owned by the moving player
+        valid = (cells == -1) | (cells == player_id)
+        # for each valid action
+        for index in np.flatnonzero(valid):
+            # take the action
+            from_pos, slide = POSSIBLE_MOVES[index]
+            # make a copy of the current game state
+            state = self.clone()
+            # perfom the action (note: _Game__move is necessary due to name mangling)
+            state._Game__move(from_pos, slide, player_id)
+            # get the equivalent canonical state
+            canonical_state = state.get_canonical_state(player_id)
+            # if it is a new canonical state
+            if canonical_state not in canonical_states:
+                # update the current player index
+                state.current_player_idx = 1 - player_id
+                # append to the list of possible transitions
+                transitions.append(((from_pos, slide), state, canonical_state))
+                # appens to the list of canonical states
+                canonical_states.add(canonical_state)
 
         return transitions
 
-    def evaluation_function(self, player_id: int, enhance: bool = False) -> int | float:
+    def evaluation_function(self, player_id: int, enhance: bool = False, winner: None | int = None) -> int | float:
         """
         Given the current state of the game, a static evaluation is performed
         and it is determined if the current position is an advantageous one
@@ -205,61 +399,56 @@ class InvestigateGame(Game):
             game: the current game state;
             player_id: the player's id.
             enhance: choose whether to weight a row according to the number of items taken.
+            winner: the winner of the game, if it has already been computed by the caller.
 
         Return:
             An estimate value of how much a Chosen Player is winning
             or losing is returned.
         """
 
-        # check if the game is over
-        value = self.check_winner()
-        # take the current player id
-        current_player = player_id
-        # take the opponent player id
-        opponent_player = 1 - player_id
-
-        # if the current player wins return +inf
-        if value == current_player:
-            return float('inf')
-        # if opponent player wins return -inf
-        elif value == opponent_player:
-            return float('-inf')
-
-        # turn each player id into a type compatible with the game board
-        current_player = np.int16(current_player)
-        opponent_player = np.int16(opponent_player)
-
+        # get the bitboards of the two players
+        bitboards = self.get_bitboards()
+        # take the current player's bitboard
+        current_player_bitboard = bitboards[player_id]
+        # take the opponent player's bitboard
+        opponent_player_bitboard = bitboards[1 - player_id]
+
+        # if the winner has already been computed by the caller
+        if winner is not None:
+            # if the current player is the winner return +inf
+            if winner == player_id:
+                return float('inf')
+            # if the opponent player is the winner return -inf
+            if winner == 1 - player_id:
+                return float('-inf')
+
+        # decide whether the scan below still has to detect a win
+        check_win = winner is None
         # define the current player's value
         current_player_value = 0
         # define the opponent player's value
         opponent_player_value = 0
-        # get the board
-        board = self.get_board()
-
-        # define which board lines to examine
-        lines = (
-            # take all rows
-            [board[y, :] for y in range(board.shape[0])]
-            # take all columns
-            + [board[:, x] for x in range(board.shape[1])]
-            # take the principal diagonal
-            + [[board[y, y] for y in range(board.shape[0])]]
-            # take the secondary diagonal
-            + [[board[y, -(y + 1)] for y in range(board.shape[0])]]
-        )
 
         # for each board line
-        for line in lines:
+        for mask in LINE_MASKS:
             # count the taken pieces by the current player
-            current_player_taken = (line == current_player).sum()
+            current_player_taken = (current_player_bitboard & mask).bit_count()
             # count the taken pieces by the opponent player
-            opponent_player_taken = (line == opponent_player).sum()
+            opponent_player_taken = (opponent_player_bitboard & mask).bit_count()
             # if all the pieces are neutral or belong to the current player
-            if opponent_player_taken == 0 and current_player_taken > 0:
-                # increment the current player's value
-                current_player_value += current_player_taken if enhance else 1
+            if opponent_player_taken == 0:
+                # a fully taken line is a win, not a heuristic
+                if check_win and current_player_taken == 5:
+                    return float('inf')
+                # if the line is open for the current player
+                if current_player_taken > 0:
+                    # increment the current player's value
+                    current_player_value += current_player_taken if enhance else 1
             # if all the pieces are neutral or belong to the opponent player
-            if current_player_taken == 0 and opponent_player_taken > 0:
+            elif current_player_taken == 0:
+                # a fully taken line is a win, not a heuristic
+                if check_win and opponent_player_taken == 5:
+                    return float('-inf')
                 # increment the opponent player's value
                 opponent_player_value += opponent_player_taken if enhance else 1
 
@@ -104,6 +104,8 @@ class Symmetry:
             - a 180° rotation to the flipped state;
             - a 270° rotation to the flipped state.
         These trasformation are applied to the original state and the swapped state.
+        The whole computation is carried out with integer permutation tables on the
+        game's Zobrist numbers, see InvestigateGame.get_canonical_state.
 
         Args:
             game: a game instance;
@@ -112,36 +114,8 @@ class Symmetry:
         Returns:
             The canonical state representation is returned.
         '''
-
-        # define list of transformed states
-        transformed_states = []
-
-        # for each swap
-        for idx, swap in enumerate(Symmetry.swaps):
-            # copy the state
-            swapped_state = deepcopy(game)
-            # swap the board
-            swapped_state._board = swap(swapped_state._board)
-            # for each flip
-            for flip in Symmetry.flips:
-                # copy the state
-                flipped_state = deepcopy(swapped_state)
-                # transform the board
-                flipped_state._board = flip(flipped_state._board)
-                # append the transformed state
-                transformed_states.append(flipped_state.get_hashable_state(player_id if idx == 0 else 1 - player_id))
-                # for each rotation
-                for rotate in Symmetry.rotations:
-                    # copy the state
-                    rotated_new_state = deepcopy(flipped_state)
-                    # transform the board
-                    rotated_new_state._board = rotate(rotated_new_state._board)
-                    # append the transformed state
-                    transformed_states.append(
-                        rotated_new_state.get_hashable_state(player_id if idx == 0 else 1 - player_id)
-                    )
-
-        return min(transformed_states)
+        # delegate to the game, which owns the Zobrist tables
+        return game.get_canonical_state(player_id)
 
     @classmethod
     def get_action_from_canonical_action(